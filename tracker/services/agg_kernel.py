@@ -0,0 +1,39 @@
+# modules/agg_kernel.py
+import numpy as np
+
+try:
+    import numba  # type: ignore
+    from numba import njit, prange  # type: ignore
+except ImportError:
+    numba = None
+
+# below this many rows pandas' own groupby is fast enough
+JIT_MIN_ROWS = 50_000
+
+
+if numba is not None:
+    @njit(cache=True, parallel=True)
+    def _group_sum_jit(codes, amts, n_groups):
+        # each thread sums its slice into its own row, then the rows are reduced
+        n_chunks = numba.get_num_threads()
+        partial = np.zeros((n_chunks, n_groups), np.float64)
+        step = (codes.size + n_chunks - 1) // n_chunks
+        for t in prange(n_chunks):
+            start = t * step
+            stop = min(start + step, codes.size)
+            for i in range(start, stop):
+                c = codes[i]
+                if c >= 0:
+                    partial[t, c] += amts[i]
+        return partial.sum(axis=0)
+
+
+def group_sum(codes, amts, n_groups):
+    """Sum amts per integer group code (codes < 0 are skipped)."""
+    codes = np.ascontiguousarray(codes, dtype=np.int32)
+    amts = np.ascontiguousarray(amts, dtype=np.float64)
+    if numba is not None:
+        return _group_sum_jit(codes, amts, n_groups)
+    # without numba, bincount is the equivalent single-pass C loop
+    valid = codes >= 0
+    return np.bincount(codes[valid], weights=amts[valid], minlength=n_groups)
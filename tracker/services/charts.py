@@ -1,21 +1,28 @@
 # visuals/charts.py
-import pandas as pd
-import matplotlib.pyplot as plt
+# Chart payloads for the Chart.js widgets; rendering happens in the browser.
 
-def expense_pie_chart(df):
-    expense_data = df[df["Type"] == "expense"]
-    if expense_data.empty:
-        print("No expense data to visualize.")
-        return
-    category_sum = expense_data.groupby("Category")["Amount"].sum()
-    category_sum.plot(kind="pie", autopct="%1.1f%%", startangle=90)
-    plt.title("Expense Distribution by Category")
-    plt.ylabel("")
-    plt.show()
 
-def income_vs_expense_bar(df):
-    income = df[df["Type"] == "income"]["Amount"].sum()
-    expense = df[df["Type"] == "expense"]["Amount"].sum()
-    plt.bar(["Income", "Expense"], [income, expense], color=["green", "red"])
-    plt.title("Income vs Expense")
-    plt.show()
+def expense_pie_data(totals):
+    """Expense per category, largest first."""
+    grouped = sorted(totals["per_category"].items(), key=lambda kv: kv[1], reverse=True)
+    return {
+        "labels": [cat for cat, _ in grouped],
+        "data": [amount for _, amount in grouped],
+    }
+
+
+def income_vs_expense_data(totals):
+    return {
+        "labels": ["Income", "Expense"],
+        "data": [totals["income"], totals["expense"]],
+    }
+
+
+def monthly_data(totals):
+    """Income and expense per month, oldest first."""
+    months = sorted(totals["per_month"])
+    return {
+        "labels": months,
+        "income": [totals["per_month"][m].get("income", 0.0) for m in months],
+        "expense": [totals["per_month"][m].get("expense", 0.0) for m in months],
+    }
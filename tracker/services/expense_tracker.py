@@ -1,36 +1,239 @@
 # modules/expense_tracker.py
 import csv
+import io
+import json
+import math
 import os
+import tempfile
+import threading
+from collections import defaultdict
 
 try:
+    import numpy as np  # type: ignore
     import pandas as pd  # type: ignore
 except ImportError:
     print("Please install pandas using: pip install pandas")
     raise
 
+try:
+    import pyarrow as pa  # type: ignore
+    import pyarrow.compute as pc  # type: ignore
+    import pyarrow.parquet as pq  # type: ignore
+except ImportError:
+    pa = None
+
+from . import polars_backend
+from .agg_kernel import JIT_MIN_ROWS, group_sum
+from .store import Store
+from .summary import Summary, months_of
+
 REQUIRED_FIELDS = ["Date", "Category", "Amount", "Type"]
 
+# files above this size are aggregated in chunks instead of loaded whole
+LARGE_FILE_BYTES = 64 * 1024 * 1024
+CHUNK_ROWS = 100_000
+
+# Arrow-backed strings when pyarrow is available, so text cleanup runs as Arrow kernels
+_TEXT_DTYPE = "string[pyarrow]" if pa is not None else "string"
+
+# parse types up front so the C parser does the conversion; empty Amount -> NaN
+_READ_OPTIONS = {
+    "dtype": {"Date": _TEXT_DTYPE, "Category": "category", "Amount": "float64", "Type": "category"},
+    "engine": "c",
+    "keep_default_na": False,
+    "na_values": {"Amount": [""]},
+}
+# chunked reads keep Amount as text (coerced per chunk)
+_CHUNK_OPTIONS = {
+    "dtype": {"Date": _TEXT_DTYPE, "Category": "category", "Amount": str, "Type": "category"},
+    "engine": "c",
+    "keep_default_na": False,
+}
+
+# with pyarrow installed, CSVs at least this large get a Parquet snapshot of the
+# parsed frame so other processes / restarts can skip CSV parsing
+SNAPSHOT_MIN_BYTES = 1024 * 1024
+
+# parsed dataframes keyed by path -> (file version, df), shared across requests
+_DF_CACHE = {}
+_CACHE_LOCK = threading.Lock()
+
+# snapshot paths with a background Parquet write in progress
+_SNAPSHOTS_PENDING = set()
+
+# serializes read-modify-write of the summary sidecar
+_SUMMARY_LOCK = threading.Lock()
+
+# characters that force a field to be csv-quoted
+_NEEDS_QUOTING = (",", '"', "\n", "\r")
+
+# Type is categorical with these leading categories, so income/expense rows can
+# be matched by integer code instead of string comparison
+TYPE_CATEGORIES = ["income", "expense", "investment"]
+INCOME_CODE = 0
+EXPENSE_CODE = 1
+
+
+def invalidate_cache(file_path):
+    """Drop the cached dataframe for file_path (call after writing to it)."""
+    with _CACHE_LOCK:
+        _DF_CACHE.pop(file_path, None)
+
+
+def _strip_text(col, lower=False):
+    # strip (and optionally lowercase) a plain text column
+    if pa is None:
+        col = col.astype(str).str.strip()
+        return col.str.lower() if lower else col
+    # one trip into Arrow: trim + lower run as compute kernels on the string buffer
+    arr = pa.array(col.astype("string[pyarrow]").array)
+    arr = pc.utf8_trim_whitespace(arr)
+    if lower:
+        arr = pc.utf8_lower(arr)
+    return pd.Series(pd.arrays.ArrowStringArray(arr), index=col.index)
+
+
+def _clean_labels(col, lower=False):
+    # strip (and optionally lowercase) a text column; for categoricals only the
+    # categories are touched and the codes are remapped
+    if not isinstance(col.dtype, pd.CategoricalDtype):
+        return _strip_text(col, lower=lower)
+
+    cats = col.cat.categories.astype(str).str.strip()
+    if lower:
+        cats = cats.str.lower()
+    if cats.is_unique:
+        return col.cat.rename_categories(cats)
+    # e.g. "Income" and "income " collapse into one category
+    new_codes, uniques = pd.factorize(cats)
+    codes = col.cat.codes.to_numpy()
+    codes = np.where(codes >= 0, new_codes[codes], -1)
+    return pd.Series(pd.Categorical.from_codes(codes, categories=uniques), index=col.index)
+
+
+def _code_types(col):
+    # fixed codes for the known types; any other values keep categories after them
+    if not isinstance(col.dtype, pd.CategoricalDtype):
+        col = col.astype("category")
+    extra = sorted(c for c in col.cat.categories if c not in TYPE_CATEGORIES)
+    return col.cat.set_categories(TYPE_CATEGORIES + extra)
+
+
+def type_codes(df):
+    """Integer Type codes of a normalized frame (see INCOME_CODE / EXPENSE_CODE)."""
+    return df["Type"].cat.codes.to_numpy()
+
+
+def _clean_amount(value, decimals=2):
+    # the amount as it will read back from disk: non-numeric / non-finite -> 0.0
+    # (what the reader turns them into), rounded like the CSV row is written
+    try:
+        amount = float(value)
+        if not math.isfinite(amount):
+            raise ValueError(value)
+    except (ValueError, TypeError):
+        # fallback: write 0.0 and warn
+        print("⚠️ Invalid amount provided, saved as 0.0")
+        return 0.0
+    return amount if decimals is None else float(f"{amount:.{decimals}f}")
+
+
+def _summary_dict(income, expense, per_category):
+    # the dashboard's summary block; top_category is the largest expense category
+    top_category = max(per_category, key=per_category.get) if per_category else None
+    return {
+        "income": income,
+        "expense": expense,
+        "balance": income - expense,
+        "top_category": top_category,
+        "top_value": per_category[top_category] if top_category is not None else 0,
+    }
+
+
+def _normalize(df):
+    # normalize columns, coerce Amount to numeric
+    if df.empty:
+        # ensure correct columns exist
+        return pd.DataFrame(columns=REQUIRED_FIELDS)
+
+    # normalize column names to expected casing
+    col_map = {}
+    for c in df.columns:
+        for req in REQUIRED_FIELDS:
+            if c.strip().lower() == req.lower():
+                col_map[c] = req
+                break
+    df = df.rename(columns=col_map)
+
+    # add missing required columns with defaults
+    for req in REQUIRED_FIELDS:
+        if req not in df.columns:
+            df[req] = ""
+
+    # coerce Amount to numeric (float). invalid -> 0
+    if not pd.api.types.is_numeric_dtype(df["Amount"]):
+        df["Amount"] = pd.to_numeric(df["Amount"], errors="coerce")
+    df["Amount"] = df["Amount"].fillna(0.0)
+
+    # normalize Type values to lowercase, strip Category and Date
+    df["Type"] = _code_types(_clean_labels(df["Type"], lower=True))
+    df["Category"] = _clean_labels(df["Category"])
+    df["Date"] = _strip_text(df["Date"])
+
+    return df
+
+
 class ExpenseTracker:
+    _ROW_FMT = "{date},{category},{amount:.2f},{type}\n"
+
     def __init__(self, file_path):
         self.file_path = file_path
+        self.store = Store(file_path)
+        root, _ = os.path.splitext(file_path)
+        self.summary_path = root + ".summary.json"
+        self.snapshot_path = root + ".parquet"
         # ensure data folder exists
         folder = os.path.dirname(file_path)
         if folder and not os.path.exists(folder):
             os.makedirs(folder, exist_ok=True)
 
-        # create file with header if not exists or if invalid
-        if not os.path.exists(file_path):
+        # (inode, mtime_ns) of the file whose header was last checked
+        self._validated = None
+        self._ensure_file()
+
+    def _ensure_file(self):
+        # create file with header if not exists or if invalid; the header is
+        # only re-read when the file changed since the last check
+        try:
+            st = os.stat(self.file_path)
+        except FileNotFoundError:
+            self._create_empty_file()
+            return
+        if (st.st_ino, st.st_mtime_ns) == self._validated:
+            return
+        # check validity of existing file, recreate if badly formatted
+        if not self._file_has_valid_header():
+            print("⚠️ Existing CSV missing required headers — recreating file with correct headers.")
             self._create_empty_file()
         else:
-            # check validity of existing file, recreate if badly formatted
-            if not self._file_has_valid_header():
-                print("⚠️ Existing CSV missing required headers — recreating file with correct headers.")
-                self._create_empty_file()
+            self._validated = (st.st_ino, st.st_mtime_ns)
 
     def _create_empty_file(self):
-        with open(self.file_path, "w", newline='', encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=REQUIRED_FIELDS)
-            writer.writeheader()
+        # a new base CSV invalidates everything derived from the old one: the ops
+        # log (its ids pointed into the old rows), the summary and the snapshot
+        with self.store.lock:
+            with open(self.file_path, "w", newline='', encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=REQUIRED_FIELDS)
+                writer.writeheader()
+            self.store.reset_log()
+            for path in (self.summary_path, self.snapshot_path):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+        invalidate_cache(self.file_path)
+        st = os.stat(self.file_path)
+        self._validated = (st.st_ino, st.st_mtime_ns)
 
     def _file_has_valid_header(self):
         try:
@@ -46,98 +249,349 @@ class ExpenseTracker:
         except Exception:
             return False
 
-    def add_transaction(self, transaction):
-        # ensure Amount is numeric and Type is normalized before writing
-        record = transaction.to_dict()
+    def add_transaction(self, transaction, sync=True):
+        self._ensure_file()
+        # read the fields straight off the transaction; no intermediate dict
+        date = "" if transaction.date is None else str(transaction.date)
+        category = "" if transaction.category is None else str(transaction.category)
         # normalize Type to lowercase
-        record["Type"] = str(record.get("Type", "")).strip().lower()
-        # ensure Amount is numeric-like string
+        t_type = "" if transaction.t_type is None else str(transaction.t_type).strip().lower()
+        # ensure Amount is numeric
+        amount = _clean_amount(transaction.amount)
+
+        if any(ch in field for field in (date, category, t_type) for ch in _NEEDS_QUOTING):
+            # rare case: let the csv module handle quoting
+            buf = io.StringIO()
+            csv.writer(buf, lineterminator="\n").writerow([date, category, f"{amount:.2f}", t_type])
+            line = buf.getvalue()
+        else:
+            line = self._ROW_FMT.format(date=date, category=category, amount=amount, type=t_type)
+
+        # the background writer coalesces concurrent appends into one writev;
+        # sync=False returns as soon as the line is queued
+        before = self._file_version()
+        pending = self.store.append(line, sync=sync)
+        if sync:
+            invalidate_cache(self.file_path)
+            self._update_summary(before, csv_growth=len(line.encode("utf-8")),
+                                 changes=[(date, category.strip(), amount, t_type, 1)])
+        return pending
+
+    def generation(self):
+        """Store generation that row ids are valid in (see Store.generation)."""
+        return self.store.generation()
+
+    def delete_transaction(self, row_id, generation=None):
+        """Delete one row by its stable id; returns False (doing nothing) if
+        generation is given and the ids have been renumbered since."""
+        # under the store lock, so no compaction can renumber rows between the lookup and the op
+        with self.store.lock:
+            if generation is not None and generation != self.store.generation():
+                return False
+            df = self._read_dataframe()
+            changes = []
+            if row_id in df.index:
+                row = df.loc[row_id]
+                changes.append((row["Date"], row["Category"], float(row["Amount"]), row["Type"], -1))
+            before = self._file_version()
+            log_growth = self.store.delete(row_id, generation)
+        invalidate_cache(self.file_path)
+        self._update_summary(before, log_growth=log_growth, changes=changes)
+        return True
+
+    def edit_transaction(self, row_id, generation=None, **fields):
+        """Update Date/Category/Amount of one row by its stable id; returns False
+        (doing nothing) if generation is given and the ids have been renumbered since."""
+        with self.store.lock:
+            if generation is not None and generation != self.store.generation():
+                return False
+            if "Amount" in fields:
+                # the log stores the amount as given, so keep it finite like add_transaction does
+                fields["Amount"] = _clean_amount(fields["Amount"], decimals=None)
+            df = self._read_dataframe()
+            changes = []
+            if row_id in df.index:
+                row = df.loc[row_id]
+                old = (row["Date"], row["Category"], float(row["Amount"]), row["Type"])
+                new = (
+                    str(fields.get("Date", old[0])).strip(),
+                    str(fields.get("Category", old[1])).strip(),
+                    float(fields.get("Amount", old[2])),
+                    old[3],
+                )
+                changes = [old + (-1,), new + (1,)]
+            before = self._file_version()
+            log_growth = self.store.edit(row_id, generation, **fields)
+        invalidate_cache(self.file_path)
+        self._update_summary(before, log_growth=log_growth, changes=changes)
+        return True
+
+    def _update_summary(self, before, changes, csv_growth=0, log_growth=0):
+        # apply a write's delta to the sidecar, but only if nothing else touched the
+        # files in between; otherwise leave it stale so the next read rebuilds it
+        after = self._file_version()
+        if before is None or after is None:
+            return
+        expected = (before[1] + csv_growth, before[3] + log_growth)
+        if (after[1], after[3]) != expected:
+            return
+        with _SUMMARY_LOCK:
+            summary = Summary.load(self.summary_path)
+            if summary is None or summary.source != list(before):
+                return
+            for date, category, amount, t_type, sign in changes:
+                summary.apply(date, category, amount, t_type, sign)
+            summary.source = list(after)
+            summary.save(self.summary_path)
+
+    def _file_version(self):
+        # (mtime_ns, size) of the CSV and of its ops log (0, 0 if absent); None if the CSV is missing
+        try:
+            st = os.stat(self.file_path)
+        except OSError:
+            return None
         try:
-            record["Amount"] = float(record.get("Amount", 0))
-        except (ValueError, TypeError):
-            # fallback: write 0.0 and warn
-            print("⚠️ Invalid amount provided, saved as 0.0")
-            record["Amount"] = 0.0
-
-        with open(self.file_path, "a", newline='', encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=REQUIRED_FIELDS)
-            writer.writerow({
-                "Date": record.get("Date", ""),
-                "Category": record.get("Category", ""),
-                "Amount": record.get("Amount", 0),
-                "Type": record.get("Type", "")
-            })
+            log_st = os.stat(self.store.log_path)
+            log_key = (log_st.st_mtime_ns, log_st.st_size)
+        except OSError:
+            log_key = (0, 0)
+        return (st.st_mtime_ns, st.st_size) + log_key
+
+    def data_version(self):
+        """Opaque version of the on-disk data; changes whenever the CSV or ops log does."""
+        return self._file_version()
 
     def _read_dataframe(self):
-        # read csv, normalize columns, coerce Amount to numeric
+        # serve the cached dataframe while the files are unchanged on disk
+        self._ensure_file()
+        version = self._file_version()
+
+        if version is not None:
+            with _CACHE_LOCK:
+                cached = _DF_CACHE.get(self.file_path)
+            if cached is not None and cached[0] == version:
+                return cached[1].copy(deep=False)
+
+        df = self._read_snapshot(version)
+        if df is None:
+            df = self._parse_dataframe()
+            self._write_snapshot(df, version)
+
+        if version is not None:
+            with _CACHE_LOCK:
+                _DF_CACHE[self.file_path] = (version, df)
+        return df.copy(deep=False)
+
+    def _read_snapshot(self, version):
+        # the Parquet snapshot is only used if it was written for this exact file version
+        if pa is None or version is None:
+            return None
+        try:
+            meta = pq.read_schema(self.snapshot_path).metadata or {}
+            if meta.get(b"tracker_source") != json.dumps(list(version)).encode():
+                return None
+            return pq.read_table(pa.memory_map(self.snapshot_path, "r")).to_pandas()
+        except (OSError, pa.ArrowException):
+            return None
+
+    def _write_snapshot(self, df, version):
+        # the snapshot only pays off in other processes / after a restart, so it is
+        # written off the request path; at most one write per path at a time
+        if pa is None or version is None or version[1] < SNAPSHOT_MIN_BYTES:
+            return
+        with _CACHE_LOCK:
+            if self.snapshot_path in _SNAPSHOTS_PENDING:
+                return
+            _SNAPSHOTS_PENDING.add(self.snapshot_path)
+        threading.Thread(
+            target=self._save_snapshot, args=(df, version), name="parquet-snapshot", daemon=True
+        ).start()
+
+    def _save_snapshot(self, df, version):
+        tmp_path = None
         try:
-            df = pd.read_csv(self.file_path, dtype=str)  # read as strings first
+            table = pa.Table.from_pandas(df)
+            meta = dict(table.schema.metadata or {})
+            meta[b"tracker_source"] = json.dumps(list(version)).encode()
+            fd, tmp_path = tempfile.mkstemp(
+                prefix=os.path.basename(self.snapshot_path) + ".", suffix=".tmp",
+                dir=os.path.dirname(self.snapshot_path) or ".",
+            )
+            os.close(fd)
+            pq.write_table(table.replace_schema_metadata(meta), tmp_path)
+            os.replace(tmp_path, self.snapshot_path)
+            tmp_path = None
+        except (OSError, pa.ArrowException) as e:
+            print("⚠️ Unable to write Parquet snapshot:", e)
+        finally:
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+            with _CACHE_LOCK:
+                _SNAPSHOTS_PENDING.discard(self.snapshot_path)
+
+    def _parse_dataframe(self):
+        try:
+            try:
+                df = self.store.load(**_READ_OPTIONS)
+            except ValueError:
+                # non-numeric Amount values (or a stray header row): read as strings and coerce
+                df = self.store.load(dtype=str, keep_default_na=False)
         except Exception as e:
             print("⚠️ Unable to read CSV:", e)
             return pd.DataFrame(columns=REQUIRED_FIELDS)
+        df = _normalize(df)
+        # keep the cached frame in date order so views can slice instead of sorting;
+        # undated rows go first so they sit at the bottom of "recent" lists
+        df = df.sort_values("Date", kind="mergesort", na_position="first")
+        if not isinstance(df["Category"].dtype, pd.CategoricalDtype):
+            df["Category"] = df["Category"].astype("category")
+        # derived "YYYY-MM" month (NaN for unparseable dates), computed once per file version
+        df["_Month"] = pd.Series(months_of(df["Date"]), index=df.index).astype("category")
+        return df
 
-        if df.empty:
-            # ensure correct columns exist
-            df = pd.DataFrame(columns=REQUIRED_FIELDS)
-            return df
-
-        # normalize column names to expected casing
-        col_map = {}
-        for c in df.columns:
-            for req in REQUIRED_FIELDS:
-                if c.strip().lower() == req.lower():
-                    col_map[c] = req
-                    break
-        df = df.rename(columns=col_map)
-
-        # add missing required columns with defaults
-        for req in REQUIRED_FIELDS:
-            if req not in df.columns:
-                df[req] = ""
+    def _is_large(self):
+        try:
+            return os.path.getsize(self.file_path) > LARGE_FILE_BYTES
+        except OSError:
+            return False
 
-        # coerce Amount to numeric (float). invalid -> 0
-        df["Amount"] = pd.to_numeric(df["Amount"], errors="coerce").fillna(0.0)
+    def iter_dataframes(self):
+        """Yield normalized data: the cached frame for small files, chunks for large ones."""
+        if not self._is_large():
+            yield self._read_dataframe()
+            return
+        try:
+            for chunk in self.store.iter_chunks(CHUNK_ROWS, **_CHUNK_OPTIONS):
+                yield _normalize(chunk)
+        except Exception as e:
+            print("⚠️ Unable to read CSV:", e)
 
-        # normalize Type values to lowercase strings
-        df["Type"] = df["Type"].astype(str).str.strip().str.lower()
+    def summarize(self):
+        """Totals from the summary sidecar, rebuilt when the data files have changed."""
+        self._ensure_file()
+        version = self._file_version()
+        summary = Summary.load(self.summary_path)
+        if summary is not None and version is not None and summary.source == list(version):
+            return summary.as_dict()
 
-        # strip whitespace from Category and Date
-        df["Category"] = df["Category"].astype(str).str.strip()
-        df["Date"] = df["Date"].astype(str).str.strip()
+        summary = self._aggregate()
+        if version is not None:
+            summary.source = list(version)
+            with _SUMMARY_LOCK:
+                # only tag the totals with version if that is still what's on disk:
+                # a write landing mid-aggregate may already be counted, and its
+                # delta must not be applied on top a second time
+                if self._file_version() != version:
+                    return summary.as_dict()
+                try:
+                    summary.save(self.summary_path)
+                except OSError as e:
+                    print("⚠️ Unable to save summary:", e)
+        return summary.as_dict()
 
-        return df
+    def _aggregate(self):
+        # full pass over the data; polars handles large files when it is installed
+        totals = None
+        if self._is_large() and polars_backend.pl is not None:
+            try:
+                # under the store lock so the scanned CSV and the ops log match
+                with self.store.lock:
+                    totals = polars_backend.aggregate(self.file_path, self.store.ops())
+            except Exception as e:
+                print("⚠️ polars aggregation failed, falling back to pandas:", e)
+        if totals is None:
+            totals = self._aggregate_pandas()
+        income, expense, per_category, per_month = totals
 
-    def view_summary(self):
-        df = self._read_dataframe()
+        summary = Summary(income=income, expense=expense)
+        summary.per_category = {cat: total for cat, total in per_category.items() if abs(total) >= 1e-9}
+        for month, by_type in per_month.items():
+            kept = {t: total for t, total in by_type.items() if abs(total) >= 1e-9}
+            if kept:
+                summary.per_month[month] = kept
+        return summary
 
-        # debug: if dataframe columns aren't present show helpful message
-        if df.empty or not set(REQUIRED_FIELDS).issubset(set(df.columns)):
-            print("⚠️ No valid data available. Add a transaction first.")
-            return df
-
-        # compute totals
-        total_income = df[df["Type"] == "income"]["Amount"].sum()
-        total_expense = df[df["Type"] == "expense"]["Amount"].sum()
-        balance = total_income - total_expense
-
-        # print summary
-        print(f"\n💰 Total Income: ₹{total_income:.2f}")
-        print(f"💸 Total Expense: ₹{total_expense:.2f}")
-        print(f"📈 Savings: ₹{balance:.2f}")
-
-        # top expense category (safely)
-        expense_df = df[df["Type"] == "expense"]
-        if not expense_df.empty:
-            # groupby Category, sum Amount
-            cat_sum = expense_df.groupby("Category", dropna=False)["Amount"].sum()
-            # if all categories are empty string, handle gracefully
-            if not cat_sum.empty and cat_sum.sum() > 0:
-                top_category = cat_sum.idxmax()
-                top_value = cat_sum.max()
-                print(f"🏆 Highest Expense Category: {top_category} (₹{top_value:.2f})")
+    def _aggregate_pandas(self):
+        # chunk by chunk, so large files never have to fit in memory
+        income = 0.0
+        expense = 0.0
+        per_category = defaultdict(float)
+        per_month = defaultdict(lambda: defaultdict(float))
+        for df in self.iter_dataframes():
+            if df.empty:
+                continue
+            # one pass over the Type codes for both totals (a handful of groups:
+            # bincount, never worth the JIT kernel)
+            codes = type_codes(df)
+            valid = codes >= 0
+            totals = np.bincount(codes[valid], weights=df["Amount"].to_numpy()[valid],
+                                 minlength=len(df["Type"].cat.categories))
+            income += float(totals[INCOME_CODE])
+            expense += float(totals[EXPENSE_CODE])
+            expense_df = df.loc[codes == EXPENSE_CODE, ["Category", "Amount"]]
+            category = expense_df["Category"]
+            if len(expense_df) > JIT_MIN_ROWS and isinstance(category.dtype, pd.CategoricalDtype):
+                # large frames: sum straight over the category codes
+                cats = category.cat.categories
+                sums = group_sum(category.cat.codes.to_numpy(), expense_df["Amount"].to_numpy(), len(cats))
+                for cat, amount in zip(cats, sums):
+                    if amount:
+                        per_category[cat] += float(amount)
             else:
-                print("No expense amounts recorded yet.")
-        else:
-            print("No expense records yet.")
+                for cat, amount in expense_df.groupby("Category", dropna=False, sort=False, observed=True)["Amount"].sum().items():
+                    per_category[cat] += float(amount)
 
-        return df
+            if "_Month" in df.columns:
+                months = df["_Month"]
+            else:
+                months = pd.Series(months_of(df["Date"]), index=df.index)
+            by_month = df.groupby([months, df["Type"]], sort=False, observed=True)["Amount"].sum()
+            for (month, t_type), amount in by_month.items():
+                per_month[month][t_type] += float(amount)
+
+        return income, expense, per_category, per_month
+
+    def dataframe(self):
+        """Normalized transactions in date order, cached per file version."""
+        return self._read_dataframe()
+
+    def compute_summary(self, df=None):
+        """Dashboard totals for all data, or for the rows of df when given."""
+        if df is None:
+            totals = self.summarize()
+            return _summary_dict(totals["income"], totals["expense"], totals["per_category"])
+        if df.empty:
+            return _summary_dict(0.0, 0.0, {})
+        codes = type_codes(df)
+        amounts = df["Amount"].to_numpy()
+        is_expense = codes == EXPENSE_CODE
+        per_category = df.loc[is_expense].groupby("Category", sort=False, observed=True)["Amount"].sum()
+        return _summary_dict(
+            float(amounts[codes == INCOME_CODE].sum()),
+            float(amounts[is_expense].sum()),
+            per_category.to_dict(),
+        )
+
+    def print_summary(self):
+        """Print the totals (CLI use); returns the summary dict."""
+        # decided from the totals alone, so large files are still only streamed
+        totals = self.summarize()
+        summary = _summary_dict(totals["income"], totals["expense"], totals["per_category"])
+        if not (totals["income"] or totals["expense"] or totals["per_month"]):
+            print("⚠️ No valid data available. Add a transaction first.")
+            return summary
+
+        print(f"\n💰 Total Income: ₹{summary['income']:.2f}")
+        print(f"💸 Total Expense: ₹{summary['expense']:.2f}")
+        print(f"📈 Savings: ₹{summary['balance']:.2f}")
+
+        if summary["top_category"] is None:
+            print("No expense records yet.")
+        elif summary["expense"] > 0:
+            print(f"🏆 Highest Expense Category: {summary['top_category']} (₹{summary['top_value']:.2f})")
+        else:
+            print("No expense amounts recorded yet.")
+        return summary
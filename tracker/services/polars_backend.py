@@ -0,0 +1,86 @@
+# modules/polars_backend.py
+try:
+    import polars as pl  # type: ignore
+except ImportError:
+    pl = None
+
+from .summary import months_of
+
+FIELDS = ["Date", "Category", "Amount", "Type"]
+
+
+def _scan(file_path, ops):
+    # lazy scan with every column as text, mirroring ExpenseTracker's string fallback
+    lf = pl.scan_csv(file_path, infer_schema=False)
+    names = lf.collect_schema().names()
+    rename = {}
+    for c in names:
+        for req in FIELDS:
+            if c.strip().lower() == req.lower() and c != req:
+                rename[c] = req
+    if rename:
+        lf = lf.rename(rename)
+    missing = [req for req in FIELDS if req not in names and req not in rename.values()]
+    if missing:
+        lf = lf.with_columns([pl.lit("").alias(req) for req in missing])
+
+    # replay the store's ops log: row ids are positions in the base CSV
+    deleted = {op.get("id") for op in ops if op.get("op") == "del"}
+    edits = {}
+    for op in ops:
+        if op.get("op") == "edit" and op.get("id") not in deleted:
+            edits.setdefault(op["id"], {}).update(op.get("fields", {}))
+    if deleted or edits:
+        lf = lf.with_row_index("_id")
+        if deleted:
+            lf = lf.filter(~pl.col("_id").is_in(list(deleted)))
+        if edits:
+            edit_cols = sorted({name for fields in edits.values() for name in fields if name in FIELDS})
+            edit_df = pl.DataFrame(
+                {
+                    "_id": list(edits),
+                    **{
+                        f"{c}_edit": [None if c not in f else str(f[c]) for f in edits.values()]
+                        for c in edit_cols
+                    },
+                },
+                schema={"_id": pl.UInt32, **{f"{c}_edit": pl.String for c in edit_cols}},
+            )
+            lf = lf.join(edit_df.lazy(), on="_id", how="left").with_columns(
+                [pl.coalesce(pl.col(f"{c}_edit"), pl.col(c)).alias(c) for c in edit_cols]
+            )
+
+    return lf.select(
+        pl.col("Date").fill_null("").str.strip_chars(),
+        pl.col("Category").fill_null("").str.strip_chars(),
+        pl.col("Amount").str.strip_chars().cast(pl.Float64, strict=False).fill_null(0.0),
+        pl.col("Type").fill_null("").str.strip_chars().str.to_lowercase(),
+    )
+
+
+def aggregate(file_path, ops):
+    """(income, expense, per_category, per_month) computed with polars' multi-threaded group-by."""
+    lf = _scan(file_path, ops)
+
+    by_type, by_category, by_date = pl.collect_all([
+        lf.group_by("Type").agg(pl.col("Amount").sum()),
+        lf.filter(pl.col("Type") == "expense").group_by("Category").agg(pl.col("Amount").sum()),
+        lf.group_by("Date", "Type").agg(pl.col("Amount").sum()),
+    ])
+
+    totals = dict(by_type.iter_rows())
+    per_category = dict(by_category.iter_rows())
+    # months come from the same helper as the incremental summary updates; only
+    # the distinct dates are parsed
+    per_month = {}
+    months = months_of(by_date["Date"].to_list())
+    for m, (_, t_type, amount) in zip(months, by_date.iter_rows()):
+        if m is not None:
+            by_type_m = per_month.setdefault(m, {})
+            by_type_m[t_type] = by_type_m.get(t_type, 0.0) + amount
+    return (
+        float(totals.get("income", 0.0)),
+        float(totals.get("expense", 0.0)),
+        per_category,
+        per_month,
+    )
@@ -0,0 +1,150 @@
+# modules/store.py
+import json
+import os
+import threading
+
+import pandas as pd
+
+from .write_queue import append_now, enqueue_append
+
+COMPACT_THRESHOLD = 1000  # log entries before the base CSV is rewritten
+
+# held by compact() for the whole rewrite, and by every CSV/log append, so no
+# write can land between compaction reading the files and replacing them
+_STORE_LOCK = threading.RLock()
+
+
+class Store:
+    """Base CSV plus an append-only log of edits/deletes.
+
+    Rows are identified by their position in the base CSV, which stays stable
+    until compact() folds the log back into the CSV. Each compaction bumps the
+    store's generation (kept as the first entry of the fresh log), so ops whose
+    ids were read before a compaction can be told apart and dropped.
+    """
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        root, _ = os.path.splitext(file_path)
+        self.log_path = root + ".ops.log"
+
+    def _read_log(self):
+        try:
+            with open(self.log_path, "r", encoding="utf-8") as f:
+                return [json.loads(line) for line in f if line.strip()]
+        except FileNotFoundError:
+            return []
+
+    def ops(self):
+        """Entries of the ops log, oldest first."""
+        return self._read_log()
+
+    @property
+    def lock(self):
+        """Lock serializing appends and compaction; hold it to resolve a row id and act on it atomically."""
+        return _STORE_LOCK
+
+    def generation(self):
+        """Number of compactions so far; row ids are only valid within one generation."""
+        try:
+            with open(self.log_path, "r", encoding="utf-8") as f:
+                first = f.readline()
+        except FileNotFoundError:
+            return 0
+        if not first.strip():
+            return 0
+        op = json.loads(first)
+        return op.get("gen", 0) if op.get("op") == "base" else 0
+
+    def _replay(self, df, ops):
+        deleted = set()
+        # ops use canonical column names; match the file's header case-insensitively
+        columns = {str(c).strip().lower(): c for c in df.columns}
+        for op in ops:
+            row_id = op.get("id")
+            if op.get("op") == "del":
+                deleted.add(row_id)
+            elif op.get("op") == "edit" and row_id in df.index and row_id not in deleted:
+                for name, value in op.get("fields", {}).items():
+                    col = columns.get(name.lower())
+                    if col is not None:
+                        if pd.api.types.is_numeric_dtype(df[col]):
+                            value = float(value)
+                        else:
+                            value = str(value)
+                            dtype = df[col].dtype
+                            if isinstance(dtype, pd.CategoricalDtype) and value not in dtype.categories:
+                                df[col] = df[col].cat.add_categories([value])
+                        df.loc[row_id, col] = value
+        if deleted:
+            df = df[~df.index.isin(deleted)]
+        return df
+
+    def _open(self):
+        # the CSV handle and log entries as of one instant: once open, the handle
+        # keeps reading the same file even if compact() swaps in a new one
+        with _STORE_LOCK:
+            return open(self.file_path, "rb"), self._read_log()
+
+    def load(self, **read_kwargs):
+        """Current view of the data, indexed by stable row id."""
+        f, ops = self._open()
+        with f:
+            df = pd.read_csv(f, **read_kwargs)
+        if ops:
+            df = self._replay(df, ops)
+        return df
+
+    def iter_chunks(self, chunksize, **read_kwargs):
+        """Like load(), but yields the data chunksize rows at a time."""
+        f, ops = self._open()
+        with f, pd.read_csv(f, chunksize=chunksize, **read_kwargs) as reader:
+            for chunk in reader:
+                yield self._replay(chunk, ops) if ops else chunk
+
+    def append(self, csv_line, sync=False):
+        """Queue one row for the base CSV; returns the write_queue PendingWrite."""
+        return enqueue_append(self.file_path, csv_line, sync=sync, lock=_STORE_LOCK)
+
+    def _append_op(self, op, generation=None):
+        # returns the number of bytes appended to the log, or 0 if the op was
+        # dropped because its row id belongs to an earlier generation. Written
+        # directly rather than through the queue, since the writer thread may be
+        # waiting on the lock
+        line = json.dumps(op) + "\n"
+        with _STORE_LOCK:
+            if generation is not None and generation != self.generation():
+                return 0
+            append_now(self.log_path, line)
+            if len(self._read_log()) > COMPACT_THRESHOLD:
+                self.compact()
+        return len(line.encode("utf-8"))
+
+    def delete(self, row_id, generation=None):
+        return self._append_op({"op": "del", "id": int(row_id)}, generation)
+
+    def edit(self, row_id, generation=None, **fields):
+        return self._append_op({"op": "edit", "id": int(row_id), "fields": fields}, generation)
+
+    def compact(self):
+        """Rewrite the base CSV with the log applied and start a fresh log."""
+        with _STORE_LOCK:
+            generation = self.generation()
+            df = self.load(dtype=str, keep_default_na=False)
+            tmp_path = self.file_path + ".tmp"
+            df.to_csv(tmp_path, index=False)
+            log_tmp_path = self._write_base_log(generation + 1)
+            os.replace(tmp_path, self.file_path)
+            os.replace(log_tmp_path, self.log_path)
+
+    def _write_base_log(self, generation):
+        # a fresh log holding only the generation marker, written to a temp path
+        log_tmp_path = self.log_path + ".tmp"
+        with open(log_tmp_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"op": "base", "gen": generation}) + "\n")
+        return log_tmp_path
+
+    def reset_log(self):
+        """Discard all ops (e.g. after the base CSV was recreated) and start a new generation."""
+        with _STORE_LOCK:
+            os.replace(self._write_base_log(self.generation() + 1), self.log_path)
@@ -0,0 +1,84 @@
+# modules/summary.py
+import json
+import os
+from dataclasses import asdict, dataclass, field
+
+import numpy as np
+import pandas as pd
+
+
+def months_of(dates):
+    """'YYYY-MM' for each date string (None where it can't be parsed), as an object array.
+
+    Every value is parsed on its own (format="mixed"), so a date maps to the same
+    month whether it is parsed alone or as part of a column. Each distinct
+    string is parsed once.
+    """
+    codes, uniques = pd.factorize(pd.Series(dates, dtype=object))
+    ts = pd.to_datetime(pd.Series(uniques, dtype=object), errors="coerce", format="mixed")
+    months = np.array([None if pd.isna(t) else f"{t.year:04d}-{t.month:02d}" for t in ts] + [None], dtype=object)
+    # factorize marks missing values with -1, which picks the trailing None
+    return months[codes]
+
+
+def month_of(date):
+    """'YYYY-MM' for a date string, or None if it can't be parsed."""
+    return months_of([date])[0]
+
+
+@dataclass
+class Summary:
+    """Running totals persisted next to the CSV and updated per write."""
+
+    income: float = 0.0
+    expense: float = 0.0
+    per_category: dict = field(default_factory=dict)  # expense total per category
+    per_month: dict = field(default_factory=dict)  # {"YYYY-MM": {type: total}}
+    source: list = None  # file version the totals were computed from
+
+    @classmethod
+    def load(cls, path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return cls(**json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def save(self, path):
+        # write to a temp file and swap it in so readers never see a partial file
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(asdict(self), f)
+        os.replace(tmp_path, path)
+
+    def apply(self, date, category, amount, t_type, sign=1):
+        """Add (sign=1) or remove (sign=-1) one row's contribution."""
+        amount = sign * amount
+        if t_type == "income":
+            self.income += amount
+        elif t_type == "expense":
+            self.expense += amount
+            total = self.per_category.get(category, 0.0) + amount
+            if abs(total) < 1e-9:
+                self.per_category.pop(category, None)
+            else:
+                self.per_category[category] = total
+
+        month = month_of(date)
+        if month is not None:
+            by_type = self.per_month.setdefault(month, {})
+            total = by_type.get(t_type, 0.0) + amount
+            if abs(total) < 1e-9:
+                by_type.pop(t_type, None)
+                if not by_type:
+                    del self.per_month[month]
+            else:
+                by_type[t_type] = total
+
+    def as_dict(self):
+        return {
+            "income": self.income,
+            "expense": self.expense,
+            "per_category": dict(self.per_category),
+            "per_month": {m: dict(v) for m, v in self.per_month.items()},
+        }
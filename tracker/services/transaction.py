@@ -1,10 +1,13 @@
 # modules/transaction.py
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
 class Transaction:
-    def __init__(self, date, category, amount, t_type):
-        self.date = date
-        self.category = category
-        self.amount = amount
-        self.t_type = t_type  # "income" or "expense"
+    date: str
+    category: str
+    amount: float
+    t_type: str  # "income" or "expense"
 
     def to_dict(self):
         return {
@@ -0,0 +1,111 @@
+# modules/write_queue.py
+import os
+import queue
+import threading
+import time
+from contextlib import nullcontext
+
+MAX_BATCH = 128
+DRAIN_INTERVAL = 0.010  # seconds to wait for more lines before flushing a batch
+
+_QUEUE = queue.Queue()
+_START_LOCK = threading.Lock()
+_writer_thread = None
+
+
+class PendingWrite:
+    """Handle returned by enqueue_append; wait() blocks until the line is on disk."""
+
+    def __init__(self, path, data, lock=None):
+        self.path = path
+        self.data = data
+        self.lock = lock
+        self.error = None
+        self._done = threading.Event()
+
+    def wait(self, timeout=None):
+        self._done.wait(timeout)
+        if self.error is not None:
+            raise self.error
+
+
+def enqueue_append(path, csv_line, sync=False, lock=None):
+    """Queue csv_line to be appended to path by the background writer.
+
+    If lock is given, the writer holds it while appending to path.
+    """
+    _ensure_writer()
+    pending = PendingWrite(path, csv_line.encode("utf-8"), lock)
+    _QUEUE.put(pending)
+    if sync:
+        pending.wait()
+    return pending
+
+
+def _ensure_writer():
+    global _writer_thread
+    if _writer_thread is not None:
+        return
+    with _START_LOCK:
+        if _writer_thread is None:
+            t = threading.Thread(target=_writer_loop, name="csv-writer", daemon=True)
+            t.start()
+            _writer_thread = t
+
+
+def _next_batch():
+    # block for the first line, then collect more until MAX_BATCH or the interval runs out
+    batch = [_QUEUE.get()]
+    deadline = time.monotonic() + DRAIN_INTERVAL
+    while len(batch) < MAX_BATCH:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        try:
+            batch.append(_QUEUE.get(timeout=remaining))
+        except queue.Empty:
+            break
+    return batch
+
+
+def _write_all(fd, chunks):
+    written = os.writev(fd, chunks)
+    total = sum(len(c) for c in chunks)
+    if written < total:
+        # short write: fall back to writing the remainder in one piece
+        rest = b"".join(chunks)[written:]
+        while rest:
+            rest = rest[os.write(fd, rest):]
+
+
+def append_now(path, line):
+    """Append line to path on the calling thread, bypassing the queue."""
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        _write_all(fd, [line.encode("utf-8")])
+    finally:
+        os.close(fd)
+
+
+def _writer_loop():
+    while True:
+        batch = _next_batch()
+
+        by_path = {}
+        for pending in batch:
+            by_path.setdefault(pending.path, []).append(pending)
+
+        for path, items in by_path.items():
+            error = None
+            try:
+                with items[0].lock or nullcontext():
+                    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                    try:
+                        _write_all(fd, [p.data for p in items])
+                    finally:
+                        os.close(fd)
+            except OSError as e:
+                error = e
+            for pending in items:
+                pending.error = error
+                pending._done.set()
@@ -1,3 +1,271 @@
+import os
+import shutil
+import tempfile
+import threading
+
+import pandas as pd
 from django.test import TestCase
+from unittest import skipIf
+
+from .services import expense_tracker as tracker_module
+from .services import polars_backend
+from .services import store as store_module
+from .services.expense_tracker import ExpenseTracker
+from .services.store import Store
+from .services.summary import Summary, month_of
+from .services.transaction import Transaction
+
+HEADER = "Date,Category,Amount,Type\n"
+
+
+class StoreTests(TestCase):
+    """Base CSV + ops log: replay, stable row ids and compaction."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, "transactions.csv")
+        self.store = Store(self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def write_rows(self, rows):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(HEADER)
+            for row in rows:
+                f.write(",".join(str(v) for v in row) + "\n")
+
+    def categories(self):
+        return list(self.store.load(dtype=str, keep_default_na=False)["Category"])
+
+    def test_load_replays_log(self):
+        self.write_rows([
+            ("2025-01-01", "Food", 10, "expense"),
+            ("2025-01-02", "Salary", 100, "income"),
+            ("2025-01-03", "Rent", 50, "expense"),
+        ])
+        self.store.delete(1)
+        self.store.edit(2, Amount=55.0)
+
+        df = self.store.load()
+        self.assertEqual(list(df.index), [0, 2])
+        self.assertEqual(df.loc[2, "Amount"], 55.0)
+        self.assertEqual(df.loc[0, "Category"], "Food")
+
+    def test_edit_then_delete(self):
+        self.write_rows([("2025-01-01", "Food", 10, "expense"), ("2025-01-02", "Rent", 50, "expense")])
+        self.store.edit(0, Category="Groceries")
+        self.store.delete(0)
+        # an edit of a deleted row is ignored on replay
+        self.store.edit(0, Category="Ignored")
+
+        df = self.store.load()
+        self.assertEqual(list(df.index), [1])
+        self.assertEqual(list(df["Category"]), ["Rent"])
+
+    def test_ids_after_compaction(self):
+        self.write_rows([(f"2025-01-0{i + 1}", f"C{i}", i, "expense") for i in range(4)])
+        self.store.delete(1)
+        self.store.edit(3, Category="C3x")
+        generation = self.store.generation()
+
+        self.store.compact()
+
+        # the log is folded into the CSV and ids are renumbered from 0
+        self.assertEqual(self.store.generation(), generation + 1)
+        df = self.store.load(dtype=str, keep_default_na=False)
+        self.assertEqual(list(df.index), [0, 1, 2])
+        self.assertEqual(list(df["Category"]), ["C0", "C2", "C3x"])
+
+        # an op whose id was read before the compaction is dropped
+        self.assertEqual(self.store.delete(0, generation=generation), 0)
+        self.assertEqual(self.categories(), ["C0", "C2", "C3x"])
+        self.assertGreater(self.store.delete(0, generation=generation + 1), 0)
+        self.assertEqual(self.categories(), ["C2", "C3x"])
+
+    def test_concurrent_ops_during_compaction(self):
+        n_rows, n_threads, per_thread = 400, 8, 10
+        self.write_rows([("2025-01-01", f"C{i}", 1, "expense") for i in range(n_rows)])
+        targets = [f"C{i}" for i in range(n_threads * per_thread)]
+
+        def delete_by_category(names):
+            for name in names:
+                while True:
+                    generation = self.store.generation()
+                    df = self.store.load(dtype=str, keep_default_na=False)
+                    ids = df.index[df["Category"] == name]
+                    if not len(ids) or self.store.delete(int(ids[0]), generation=generation):
+                        break
+
+        old_threshold = store_module.COMPACT_THRESHOLD
+        store_module.COMPACT_THRESHOLD = 5
+        try:
+            threads = [
+                threading.Thread(target=delete_by_category, args=(targets[k::n_threads],))
+                for k in range(n_threads)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        finally:
+            store_module.COMPACT_THRESHOLD = old_threshold
+
+        self.assertGreater(self.store.generation(), 0)
+        remaining = self.categories()
+        self.assertEqual(len(remaining), n_rows - len(targets))
+        self.assertFalse(set(targets) & set(remaining))
+
+
+class SummaryTests(TestCase):
+    """The delta-maintained summary sidecar must match a full rebuild."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.tracker = ExpenseTracker(os.path.join(self.tmp_dir, "transactions.csv"))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def assert_matches_rebuild(self):
+        # the sidecar must have been updated in place, not rebuilt
+        saved = Summary.load(self.tracker.summary_path)
+        self.assertEqual(saved.source, list(self.tracker.data_version()))
+        incremental = self.tracker.summarize()
+        os.remove(self.tracker.summary_path)
+        self.assertEqual(incremental, self.tracker.summarize())
+
+    def test_deltas_match_rebuild(self):
+        tracker = self.tracker
+        tracker.summarize()
+        rows = [
+            ("2025-01-05", "Food", 10.0, "expense"),
+            ("05/11/2025", "Rent", 50.0, "expense"),
+            ("Nov 3 2025", "Salary", 200.0, "income"),
+            ("not a date", "Food", 5.0, "expense"),
+            ("2025-12-01", "SIP", 30.0, "investment"),
+        ]
+        for row in rows:
+            tracker.add_transaction(Transaction(*row))
+            self.assert_matches_rebuild()
+
+        tracker.edit_transaction(0, Date="2025/02/07", Category="Groceries", Amount=12.5)
+        self.assert_matches_rebuild()
+        tracker.edit_transaction(3, Date="2025-03-01")
+        self.assert_matches_rebuild()
+        tracker.delete_transaction(1)
+        self.assert_matches_rebuild()
+        tracker.delete_transaction(2)
+        self.assert_matches_rebuild()
+
+    def test_deltas_use_the_written_amount(self):
+        tracker = self.tracker
+        tracker.summarize()
+        for amount in (10.006, 99.999, "nan", "inf", "abc"):
+            tracker.add_transaction(Transaction("2025-01-05", "Food", amount, "expense"))
+            self.assert_matches_rebuild()
+        self.assertEqual(tracker.summarize()["expense"], 110.01)
+
+        tracker.edit_transaction(0, Amount=float("nan"))
+        self.assert_matches_rebuild()
+        self.assertEqual(tracker.summarize()["expense"], 100.0)
+
+    def test_month_matches_cached_frame(self):
+        dates = ["2025-01-05", "05/11/2025", "Nov 3 2025", "2025/12/01", "bad", ""]
+        for date in dates:
+            self.tracker.add_transaction(Transaction(date, "Food", 1.0, "expense"))
+        df = self.tracker.dataframe()
+        for date, month in zip(df["Date"], df["_Month"]):
+            self.assertEqual(month_of(date), None if pd.isna(month) else month)
+
+    def test_recreated_file_drops_old_ops(self):
+        tracker = self.tracker
+        tracker.add_transaction(Transaction("2025-01-01", "Food", 5.0, "expense"))
+        tracker.delete_transaction(0)
+        generation = tracker.store.generation()
+
+        # a missing CSV is recreated; the old log's delete of id 0 must not hit the new row
+        os.remove(tracker.file_path)
+        tracker.add_transaction(Transaction("2025-01-02", "Rent", 7.0, "expense"))
+        self.assertEqual(list(tracker.dataframe()["Category"]), ["Rent"])
+        self.assertEqual(tracker.summarize()["expense"], 7.0)
+        self.assertGreater(tracker.store.generation(), generation)
+
+        # same for a file with a bad header
+        with open(tracker.file_path, "w", encoding="utf-8") as f:
+            f.write("bad,header\n1,2\n")
+        tracker.add_transaction(Transaction("2025-01-03", "Salary", 9.0, "income"))
+        self.assertEqual(list(tracker.dataframe()["Category"]), ["Salary"])
+        self.assertEqual(tracker.summarize()["expense"], 0.0)
+
+    def test_stale_generation_is_refused(self):
+        tracker = self.tracker
+        for i in range(5):
+            tracker.add_transaction(Transaction(f"2025-01-0{i + 1}", f"C{i}", 1.0, "expense"))
+        # a page rendered now links C3 as id 3
+        generation = tracker.generation()
+
+        # another request's delete triggers a compaction, renumbering the rows
+        tracker.delete_transaction(0, generation)
+        tracker.store.compact()
+
+        self.assertFalse(tracker.delete_transaction(3, generation))
+        self.assertFalse(tracker.edit_transaction(3, generation, Category="X"))
+        self.assertEqual(list(tracker.dataframe()["Category"]), ["C1", "C2", "C3", "C4"])
+        self.assertTrue(tracker.delete_transaction(2, tracker.generation()))
+        self.assertEqual(list(tracker.dataframe()["Category"]), ["C1", "C2", "C4"])
+
+
+@skipIf(polars_backend.pl is None, "polars is not installed")
+class PolarsParityTests(TestCase):
+    """polars and the chunked pandas path must agree on large-file totals."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, "transactions.csv")
+        self.limits = (tracker_module.LARGE_FILE_BYTES, tracker_module.CHUNK_ROWS)
+        # every file counts as large, and chunks are a few rows
+        tracker_module.LARGE_FILE_BYTES = 0
+        tracker_module.CHUNK_ROWS = 3
+
+    def tearDown(self):
+        tracker_module.LARGE_FILE_BYTES, tracker_module.CHUNK_ROWS = self.limits
+        shutil.rmtree(self.tmp_dir)
+
+    @staticmethod
+    def rounded(totals):
+        income, expense, per_category, per_month = totals
+
+        def clean(d):
+            return {k: round(v, 6) for k, v in d.items() if abs(v) >= 1e-9}
+
+        return (
+            round(income, 6),
+            round(expense, 6),
+            clean(per_category),
+            {m: clean(by_type) for m, by_type in per_month.items() if clean(by_type)},
+        )
+
+    def test_aggregates_match(self):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(" date ,CATEGORY, Amount ,type\n")
+            f.write("2025-01-05, Food ,10.5,Expense \n")
+            f.write("2025-01-06,Salary,1000,INCOME\n")
+            f.write("05/02/2025,Rent, 300 ,expense\n")
+            f.write("bad date,Food,abc,expense\n")
+            f.write("2025-02-10,Food,,expense\n")
+            f.write("Nov 3 2025,SIP,250,investment\n")
+            f.write("2025-03-01,Gift,20,refund\n")
+            f.write("2025-03-02,Travel,75.25,expense\n")
+            f.write("2025-03-05,Bonus,50, Income\n")
+        tracker = ExpenseTracker(self.path)
+        tracker.store.delete(1)
+        tracker.store.edit(2, Amount=320.0, Category="Rent ")
+        tracker.store.edit(7, Date="2025-04-01", Category="Trips")
+        tracker.store.edit(1, Amount=5.0)  # edit of a deleted row
 
-# Create your tests here.
+        ops = tracker.store.ops()
+        self.assertEqual(
+            self.rounded(tracker._aggregate_pandas()),
+            self.rounded(polars_backend.aggregate(tracker.file_path, ops)),
+        )
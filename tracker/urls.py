@@ -7,8 +7,10 @@ urlpatterns = [
     path('add-investment/', views.add_investment, name='add_investment'),
     path('investments/', views.analyze_investment, name='investments'),
     path('manage-investments/', views.manage_investments, name='manage_investments'),
-    path('edit-investment/<int:row_id>/', views.edit_investment, name='edit_investment'),
-    path('delete-investment/<int:row_id>/', views.delete_investment, name='delete_investment'),
+    path('edit-investment/<int:generation>/<int:row_id>/', views.edit_investment, name='edit_investment'),
+    path('delete-investment/<int:generation>/<int:row_id>/', views.delete_investment, name='delete_investment'),
     path('api/expense-chart/', views.expense_chart_data, name='expense_chart_data'),
-    path('delete/<int:row_id>/', views.delete_transaction, name='delete_transaction'),
+    path('api/income-expense/', views.income_expense_data, name='income_expense_data'),
+    path('api/monthly/', views.monthly_data, name='monthly_data'),
+    path('delete/<int:generation>/<int:row_id>/', views.delete_transaction, name='delete_transaction'),
 ]
\ No newline at end of file
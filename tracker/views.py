@@ -1,9 +1,15 @@
 from django.shortcuts import render, redirect
 from django.http import JsonResponse
 from django.conf import settings
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import etag
+from django.views.decorators.vary import vary_on_cookie
 import os
+import re
+import numpy as np
 import pandas as pd
 
+from .services import charts
 from .services.expense_tracker import ExpenseTracker
 from .services.transaction import Transaction
 from .services.investment import InvestmentAnalyzer
@@ -11,18 +17,57 @@ from .services.investment import InvestmentAnalyzer
 # ✅ CSV file path
 DATA_FILE = os.path.join(settings.BASE_DIR, "data", "transactions.csv")
 
-# Ensure file exists and has valid headers
-if not os.path.exists(DATA_FILE):
-    pd.DataFrame(columns=["Date", "Category", "Amount", "Type"]).to_csv(DATA_FILE, index=False)
+# One tracker per CSV path for the whole process; it creates the file with a
+# valid header on first use and keeps its caches between requests
+_TRACKERS = {}
+
+
+def get_tracker(path=DATA_FILE):
+    tracker = _TRACKERS.get(path)
+    if tracker is None:
+        tracker = _TRACKERS[path] = ExpenseTracker(path)
+    return tracker
+
+
+def _data_etag(request, *args, **kwargs):
+    """ETag for the tracker's current data version (None if the file is missing)."""
+    version = get_tracker().data_version()
+    if version is None:
+        return None
+    return "-".join(f"{v:x}" for v in version)
+
+
+# conditional GET on the data version; the headers apply to 304s as well
+_revalidate = cache_control(private=True, max_age=0, must_revalidate=True)
+
+
+# Categories that count as investments
+INV_PAT = re.compile(r"invest|sip|mf|fund|stock", re.IGNORECASE)
+
+
+def _investment_mask(category):
+    """Boolean mask of rows whose Category matches INV_PAT."""
+    if isinstance(category.dtype, pd.CategoricalDtype):
+        # match each distinct category once, then broadcast through the codes
+        hits = np.asarray(category.cat.categories.str.contains(INV_PAT), dtype=bool)
+        codes = category.cat.codes.to_numpy()
+        return pd.Series(np.where(codes >= 0, hits[codes], False), index=category.index)
+    return category.astype(str).str.contains(INV_PAT, na=False)
 
 
 # -----------------------------------------------
 # 🏠 DASHBOARD VIEW
 # -----------------------------------------------
+@vary_on_cookie
+@_revalidate
+@etag(_data_etag)  # the page depends only on the data and the query string (part of the URL)
 def home(request):
     """Main dashboard page with filters, search, and delete support."""
-    tracker = ExpenseTracker(DATA_FILE)
-    df = tracker.view_summary()
+    tracker = get_tracker()
+    # read before the data: if a compaction slips in between, the links are
+    # merely refused rather than pointed at renumbered rows
+    generation = tracker.generation()
+    df = tracker.dataframe()
 
     # Remove duplicate headers and invalid rows
     if not df.empty and "Date" in df["Date"].values:
@@ -40,39 +85,27 @@ def home(request):
         if category_filter and category_filter != "All":
             df = df[df["Category"] == category_filter]
         if search_query:
-            df = df[df.apply(lambda x: search_query in str(x).lower(), axis=1)]
-
-    # Prepare summary
-    summary = {
-        "income": 0,
-        "expense": 0,
-        "balance": 0,
-        "top_category": None,
-        "top_value": 0,
-    }
+            # one lowercased haystack per row, matched with pandas' string kernels
+            hay = (df["Date"].astype(str) + "|" + df["Category"].astype(str) + "|"
+                   + df["Amount"].astype(str) + "|" + df["Type"].astype(str)).str.lower()
+            df = df[hay.str.contains(search_query, regex=False, na=False)]
 
-    if not df.empty:
-        summary["income"] = float(df[df["Type"] == "income"]["Amount"].sum())
-        summary["expense"] = float(df[df["Type"] == "expense"]["Amount"].sum())
-        summary["balance"] = summary["income"] - summary["expense"]
-
-        expense_df = df[df["Type"] == "expense"]
-        if not expense_df.empty:
-            grouped = expense_df.groupby("Category")["Amount"].sum().sort_values(ascending=False)
-            if not grouped.empty:
-                summary["top_category"] = grouped.index[0]
-                summary["top_value"] = grouped.iloc[0]
+    # Prepare summary: unfiltered totals come straight from the tracker's summary sidecar
+    filtered = bool(month_filter or (category_filter and category_filter != "All") or search_query)
+    summary = tracker.compute_summary(df if filtered else None)
 
     # Dropdown filters
     all_months = sorted(df["Date"].astype(str).str[:7].unique()) if not df.empty else []
     all_categories = sorted(df["Category"].unique()) if not df.empty else []
 
-    # Show last 10 filtered transactions
-    recent = df.sort_values("Date", ascending=False).head(10).reset_index(drop=True).to_dict("records") if not df.empty else []
+    # Show last 10 filtered transactions (the tracker keeps rows sorted by Date)
+    # namedtuples rather than dicts; row.Index is the stable row id used by the delete link
+    recent = list(df.iloc[-10:][::-1].itertuples()) if not df.empty else []
 
     return render(request, "tracker/dashboard.html", {
         "summary": summary,
         "recent": recent,
+        "generation": generation,
         "months": all_months,
         "categories": all_categories,
         "selected_month": month_filter or "",
@@ -93,7 +126,7 @@ def add_transaction(request):
         t_type = request.POST.get("t_type")
 
         trans = Transaction(date, category, amount, t_type)
-        tracker = ExpenseTracker(DATA_FILE)
+        tracker = get_tracker()
         tracker.add_transaction(trans)
 
         return redirect("home")
@@ -109,7 +142,7 @@ def add_investment(request):
         t_type = "investment"  # auto-set
 
         trans = Transaction(date, category, amount, t_type)
-        tracker = ExpenseTracker(DATA_FILE)
+        tracker = get_tracker()
         tracker.add_transaction(trans)
 
         return redirect("manage_investments")
@@ -121,34 +154,33 @@ def add_investment(request):
 # -----------------------------------------------
 def analyze_investment(request):
     """Analyze and visualize investment performance."""
-    tracker = ExpenseTracker(DATA_FILE)
-    df = tracker.view_summary()
+    tracker = get_tracker()
+    df = tracker.dataframe()
 
     if df.empty:
         return render(request, "tracker/investment.html", {"error": "No transactions found."})
 
     # Detect investment transactions flexibly
-    inv_df = df[df["Category"].str.lower().str.contains("invest|sip|mf|fund|stock", na=False)]
+    inv_df = df[_investment_mask(df["Category"])]
 
     if inv_df.empty:
         return render(request, "tracker/investment.html", {"error": "No investment data available."})
 
-    inv_df["Date"] = pd.to_datetime(inv_df["Date"], errors="coerce")
-    inv_df = inv_df.dropna(subset=["Date"])
-    inv_df["Month"] = inv_df["Date"].dt.strftime("%Y-%m")
+    # _Month is precomputed by the tracker; rows with unparseable dates have none
+    inv_df = inv_df.dropna(subset=["_Month"])
 
-    monthly_summary = inv_df.groupby("Month")["Amount"].sum().reset_index().sort_values("Month")
-    labels = monthly_summary["Month"].tolist()
+    monthly_summary = inv_df.groupby("_Month", sort=True, observed=True)["Amount"].sum().reset_index()
+    labels = monthly_summary["_Month"].tolist()
     data = monthly_summary["Amount"].tolist()
 
     total_invested = float(inv_df["Amount"].sum())
     avg_monthly = round(total_invested / len(monthly_summary), 2) if len(monthly_summary) > 0 else 0
 
-    cat_breakdown = inv_df.groupby("Category")["Amount"].sum().sort_values(ascending=False).reset_index()
+    cat_breakdown = inv_df.groupby("Category", sort=False, observed=True)["Amount"].sum().sort_values(ascending=False).reset_index()
     cat_labels = cat_breakdown["Category"].tolist()
     cat_data = cat_breakdown["Amount"].tolist()
 
-    recent_investments = inv_df.sort_values("Date", ascending=False).head(10).to_dict("records")
+    recent_investments = list(inv_df.iloc[-10:][::-1].itertuples(index=False))
 
     context = {
         "total_invested": total_invested,
@@ -168,74 +200,86 @@ def analyze_investment(request):
 # -----------------------------------------------
 def manage_investments(request):
     """View and manage all investment transactions."""
-    df = pd.read_csv(DATA_FILE)
+    tracker = get_tracker()
+    generation = tracker.generation()
+    df = tracker.dataframe()
 
-    if df.empty or not any(df["Category"].str.lower().str.contains("invest")):
+    inv_mask = _investment_mask(df["Category"]) if not df.empty else None
+    if df.empty or not inv_mask.any():
         return render(request, "tracker/manage_investments.html", {"error": "No investment records found."})
 
-    inv_df = df[df["Category"].str.lower().str.contains("invest")].copy().reset_index(drop=True)
-    inv_df["id"] = inv_df.index
+    # row.Index is the stable row id kept by the tracker, shared with edit/delete below
+    inv_df = df[inv_mask]
 
-    return render(request, "tracker/manage_investments.html", {"investments": inv_df.to_dict("records")})
+    return render(request, "tracker/manage_investments.html", {
+        "investments": list(inv_df.itertuples()),
+        "generation": generation,
+    })
 
 
 # -----------------------------------------------
 # ✏️ EDIT & DELETE INVESTMENT
 # -----------------------------------------------
-def edit_investment(request, row_id):
+def edit_investment(request, generation, row_id):
     """Edit an existing investment by its row ID."""
-    df = pd.read_csv(DATA_FILE).reset_index(drop=True)
+    tracker = get_tracker()
+    # a link from before a compaction may point at a different row now
+    if generation != tracker.generation():
+        return redirect("manage_investments")
 
-    if row_id >= len(df):
+    df = tracker.dataframe()
+    if row_id not in df.index:
         return redirect("manage_investments")
 
     if request.method == "POST":
-        df.loc[row_id, "Date"] = request.POST.get("date")
-        df.loc[row_id, "Category"] = request.POST.get("category")
-        df.loc[row_id, "Amount"] = float(request.POST.get("amount"))
-        df.to_csv(DATA_FILE, index=False)
+        tracker.edit_transaction(
+            row_id,
+            generation,
+            Date=request.POST.get("date"),
+            Category=request.POST.get("category"),
+            Amount=float(request.POST.get("amount")),
+        )
         return redirect("manage_investments")
 
     investment = df.loc[row_id]
     return render(request, "tracker/edit_investment.html", {"investment": investment, "row_id": row_id})
 
 
-def delete_investment(request, row_id):
+def delete_investment(request, generation, row_id):
     """Delete only the specific investment safely."""
-    df = pd.read_csv(DATA_FILE).reset_index(drop=True)
-    if 0 <= row_id < len(df):
-        df = df.drop(row_id).reset_index(drop=True)
-        df.to_csv(DATA_FILE, index=False)
+    # appends a tombstone; unknown ids are ignored on replay
+    get_tracker().delete_transaction(row_id, generation)
     return redirect("manage_investments")
 
 
 # -----------------------------------------------
 # ❌ DELETE SPECIFIC TRANSACTION
 # -----------------------------------------------
-def delete_transaction(request, row_id):
+def delete_transaction(request, generation, row_id):
     """Safely delete only one transaction."""
-    df = pd.read_csv(DATA_FILE).reset_index(drop=True)
-    if 0 <= row_id < len(df):
-        df = df.drop(row_id).reset_index(drop=True)
-        df.to_csv(DATA_FILE, index=False)
+    get_tracker().delete_transaction(row_id, generation)
     return redirect("home")
 
 
 # -----------------------------------------------
 # 📊 CHART DATA
 # -----------------------------------------------
+@_revalidate
+@etag(_data_etag)
 def expense_chart_data(request):
     """Return expense data by category for Chart.js."""
-    tracker = ExpenseTracker(DATA_FILE)
-    df = tracker.view_summary()
+    return JsonResponse(charts.expense_pie_data(get_tracker().summarize()))
 
-    expense_df = df[df["Type"] == "expense"] if not df.empty else pd.DataFrame()
 
-    if expense_df.empty:
-        return JsonResponse({"labels": [], "data": []})
+@_revalidate
+@etag(_data_etag)
+def income_expense_data(request):
+    """Return total income vs expense for Chart.js."""
+    return JsonResponse(charts.income_vs_expense_data(get_tracker().summarize()))
 
-    grouped = expense_df.groupby("Category")["Amount"].sum().sort_values(ascending=False)
-    labels = grouped.index.tolist()
-    data = grouped.values.tolist()
 
-    return JsonResponse({"labels": labels, "data": data})
+@_revalidate
+@etag(_data_etag)
+def monthly_data(request):
+    """Return income and expense per month for Chart.js."""
+    return JsonResponse(charts.monthly_data(get_tracker().summarize()))